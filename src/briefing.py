@@ -0,0 +1,569 @@
+"""Daily market briefing entrypoint.
+
+Phase 1: domestic + overseas + forex + commodity sections with FinanceDataReader.
+Supports optional target date for reproducible runs in GitHub Actions.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import hashlib
+import time
+from dataclasses import dataclass
+from datetime import date, datetime, timedelta
+from functools import lru_cache
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    import pandas as pd
+    import requests
+
+# FinanceDataReader/pandas/requests는 임포트만으로 수백 ms가 드는 무거운
+# 의존성이라 실제 fetch 시점에 함수 안에서 지연 임포트한다
+# (--help 등 네트워크를 안 타는 경로가 가벼워진다. sys.modules 캐시 덕에
+# 두 번째 호출부터는 비용이 없다)
+
+
+@lru_cache(maxsize=1)
+def _session() -> requests.Session:
+    """직접 호출하는 HTTP용 공용 세션. keep-alive 커넥션을 재사용한다.
+
+    TLS 핸드셰이크를 요청마다 반복하지 않도록 풀 크기를 동시 fetch 수에 맞춘다.
+    """
+    import requests
+    from requests.adapters import HTTPAdapter
+
+    session = requests.Session()
+    session.mount("https://", HTTPAdapter(pool_connections=8, pool_maxsize=8))
+    return session
+
+
+@dataclass(slots=True, frozen=True)
+class IndexSummary:
+    name: str
+    close: float | None
+    change_pct: float | None
+    arrow: str
+    color_class: str
+    base_date: str | None
+    decimals: int = 2
+    error: str | None = None
+
+
+def _parse_target_date(target_date: str | None) -> date | None:
+    if not target_date:
+        return None
+    # YYYY-MM-DD 고정 형식이므로 strptime의 포맷 해석 없이 C 경로로 파싱한다
+    return date.fromisoformat(target_date)
+
+
+# 백필로 수백 일치를 연달아 생성할 때 같은 값의 포맷 결과를 재사용한다
+@lru_cache(maxsize=4096)
+def _format_close(value: float | None, decimals: int) -> str:
+    if value is None:
+        return "N/A"
+    return f"{value:,.{decimals}f}"
+
+
+@lru_cache(maxsize=4096)
+def _format_pct(value: float | None) -> str:
+    if value is None:
+        return "N/A"
+    return f"{abs(value):.2f}%"
+
+
+_RETRY_ATTEMPTS = 3
+_RETRY_BASE_DELAY = 0.3  # 초. 재시도마다 2배씩 늘어난다
+
+
+def _fetch_raw(symbol: str, start: str, end: str, allow_empty: bool = False) -> pd.DataFrame:
+    """fdr.DataReader를 호출하되 일시적 오류/빈 응답에 지수 백오프로 재시도한다.
+
+    네트워크가 잠깐 흔들렸다고 해당 지수가 브리핑에서 'N/A'로 빠지는 일을
+    줄인다. allow_empty=True면 빈 프레임도 정상 응답으로 보고 바로 돌려준다
+    (캐시 꼬리 연장처럼 '새 행 없음'이 자연스러운 호출용). 아니면 빈 프레임은
+    재시도하되, 끝까지 비어 있으면 예외 대신 빈 프레임을 그대로 반환해
+    호출부가 더 넓은 창으로 다시 시도할 수 있게 한다. 예외로만 끝난 경우에는
+    마지막 예외를 올린다.
+    """
+    import FinanceDataReader as fdr
+
+    last_exc: Exception | None = None
+    df: pd.DataFrame | None = None
+    for attempt in range(_RETRY_ATTEMPTS):
+        if attempt:
+            time.sleep(_RETRY_BASE_DELAY * 2 ** (attempt - 1))
+        try:
+            df = fdr.DataReader(symbol, start, end)
+        except Exception as exc:  # noqa: BLE001 - 일시 오류와 영구 오류를 구분할 방법이 없다
+            last_exc = exc
+            continue
+        if allow_empty or not df.empty:
+            return df
+    if df is not None:
+        return df
+    raise last_exc  # type: ignore[misc]
+
+
+def _cache_path(cache_dir: Path, symbol: str) -> Path:
+    # "USD/KRW", "GC=F" 같은 심볼에는 파일명에 쓸 수 없는 문자가 섞여 있다
+    return cache_dir / (symbol.replace("/", "_").replace("=", "_") + ".parquet")
+
+
+def _load_close_series(
+    symbol: str, start_date: date, end_date: date, cache_dir: Path | None
+) -> pd.Series | None:
+    """일별 Close 시리즈를 구한다. Close 컬럼 자체가 없으면 None.
+
+    cache_dir가 주어지면 심볼별 parquet 캐시를 먼저 읽고, 어제 종가까지
+    이미 있으면 네트워크를 건너뛰며, 아니면 빠진 꼬리 구간만 내려받아
+    캐시를 늘려 저장한다. 확정된 과거 종가만 남기므로(아래에서 당일 행을
+    잘라낸다) 캐시된 값이 나중에 바뀔 일은 없다.
+    """
+    import pandas as pd
+
+    # 장중 실행(워크플로는 10:17 KST) 시 제공자가 돌려주는 오늘 날짜 행은 아직
+    # 확정되지 않은 스냅샷이다. 캐시에 들어가면 다음 날 '전일 종가'로 둔갑하므로
+    # 오늘 이후 행은 읽을 때도, 내려받은 데이터를 저장할 때도 모두 잘라낸다
+    settled_cutoff = pd.Timestamp(date.today()) - pd.Timedelta(days=1)
+
+    cache_path = _cache_path(cache_dir, symbol) if cache_dir is not None else None
+    cached: pd.Series | None = None
+    if cache_path is not None and cache_path.exists():
+        try:
+            cached = pd.read_parquet(cache_path)["Close"].dropna().loc[:settled_cutoff]
+        except (OSError, KeyError, ValueError):
+            cached = None
+
+    fetch_start = start_date
+    if cached is not None and not cached.empty:
+        # 첫 거래일은 start_date보다 며칠 뒤일 수 있으므로 약간의 여유를 두고 판정한다
+        head_covered = cached.index[0].date() <= start_date + timedelta(days=5)
+        tail_covered = cached.index[-1].date() >= end_date - timedelta(days=1)
+        if head_covered and tail_covered:
+            return cached
+        if head_covered:
+            fetch_start = max(start_date, cached.index[-1].date() + timedelta(days=1))
+
+    # 캐시 꼬리를 연장하는 중이면 빈 응답은 '아직 새 거래일이 없다'는 뜻이므로
+    # 재시도 없이 받아들이고 캐시만으로 답한다 (주말 직후 실행이 전형적 사례)
+    extending = cached is not None and not cached.empty
+    df = _fetch_raw(symbol, fetch_start.isoformat(), end_date.isoformat(), allow_empty=extending)
+    if df.empty or "Close" not in df.columns:
+        return cached
+    fresh = df["Close"].dropna().loc[:settled_cutoff]
+
+    if cached is not None and not cached.empty:
+        merged = pd.concat([cached, fresh])
+        merged = merged[~merged.index.duplicated(keep="last")].sort_index()
+    else:
+        merged = fresh
+
+    if cache_path is not None and not merged.empty:
+        try:
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            merged.to_frame().to_parquet(cache_path)
+        except (OSError, ImportError, ValueError):
+            # 캐시는 최적화일 뿐이므로 저장 실패가 브리핑 생성을 막으면 안 된다
+            pass
+    return merged
+
+
+# 등락 부호(-1/0/1) → (화살표, CSS 클래스). np.sign 벡터 결과로도 그대로 조회 가능
+_SIGN_MAP = {
+    1: ("▲", "up"),
+    -1: ("▼", "down"),
+    0: ("-", "flat"),
+}
+
+
+def _summarize_closes(name: str, close_series: pd.Series, decimals: int) -> IndexSummary:
+    """직전 거래일 기준으로 잘린 Close 시리즈에서 등락 요약을 만든다."""
+    # .iloc 스칼라 접근은 호출마다 인덱서를 거치므로 numpy 배열로 바로 꺼낸다
+    values = close_series.to_numpy()
+    if values.size < 2:
+        return IndexSummary(
+            name=name,
+            close=None,
+            change_pct=None,
+            arrow="-",
+            color_class="na",
+            base_date=None,
+            decimals=decimals,
+            error="not-enough-close-values",
+        )
+
+    prev_close = float(values[-2])
+    close = float(values[-1])
+    change_pct = ((close - prev_close) / prev_close) * 100
+
+    sign = (change_pct > 0) - (change_pct < 0)
+    arrow, color_class = _SIGN_MAP[sign]
+
+    return IndexSummary(
+        name=name,
+        close=close,
+        change_pct=change_pct,
+        arrow=arrow,
+        color_class=color_class,
+        base_date=close_series.index[-1].date().isoformat(),
+        decimals=decimals,
+    )
+
+
+def fetch_index_summary(
+    name: str,
+    symbol: str,
+    run_date: date,
+    decimals: int = 2,
+    cache_dir: Path | None = None,
+) -> IndexSummary:
+    import pandas as pd
+
+    cutoff = pd.Timestamp(run_date) - pd.Timedelta(days=1)
+
+    try:
+        # 마지막 두 종가만 필요하므로 기본 10일 창으로 받고(주말+짧은 연휴 커버),
+        # 추석/골든위크 같은 긴 연휴로 부족할 때만 30일 창으로 한 번 더 받는다
+        close_series = None
+        for window_days in (10, 30):
+            start_date = run_date - timedelta(days=window_days)
+            fetched = _load_close_series(symbol, start_date, run_date, cache_dir)
+            if fetched is None:
+                continue
+            # "전일 시장 요약" 기준: 실행일(run_date) 당일 데이터는 제외하고 직전 거래일을 기준일로 사용.
+            # 정렬된 DatetimeIndex이므로 .loc 슬라이스가 파이썬 비교 루프 없이 이진 탐색으로 자른다
+            close_series = fetched.loc[:cutoff]
+            if len(close_series) >= 2:
+                break
+        if close_series is None:
+            return IndexSummary(
+                name=name,
+                close=None,
+                change_pct=None,
+                arrow="-",
+                color_class="na",
+                base_date=None,
+                decimals=decimals,
+                error="not-enough-data",
+            )
+
+        return _summarize_closes(name, close_series, decimals)
+    except Exception as exc:  # noqa: BLE001
+        return IndexSummary(
+            name=name,
+            close=None,
+            change_pct=None,
+            arrow="-",
+            color_class="na",
+            base_date=None,
+            decimals=decimals,
+            error=str(exc),
+        )
+
+
+_SPARK_URL = "https://query1.finance.yahoo.com/v8/finance/spark"
+# FinanceDataReader 심볼 → Yahoo spark 심볼 (배치 호출 가능한 해외 지수만)
+_YAHOO_SPARK_SYMBOLS = {
+    "DJI": "^DJI",
+    "IXIC": "^IXIC",
+    "SSEC": "000001.SS",
+    "N225": "^N225",
+}
+
+
+def fetch_overseas_batch(
+    specs: list[tuple[str, str, int]],
+    run_date: date,
+    cache_dir: Path | None = None,
+) -> list[IndexSummary]:
+    """해외 지수 묶음을 Yahoo spark 엔드포인트 호출 한 번으로 가져온다.
+
+    심볼당 한 번씩 왕복하는 대신 symbols=... 로 묶어 HTTP 요청을 1회로
+    줄인다. 배치 호출이 어떤 이유로든 실패하면 기존 심볼별
+    fetch_index_summary 경로로 되돌아간다.
+    """
+    import numpy as np
+    import pandas as pd
+
+    cutoff = pd.Timestamp(run_date) - pd.Timedelta(days=1)
+    try:
+        yahoo_symbols = [_YAHOO_SPARK_SYMBOLS[symbol] for _, symbol, _ in specs]
+        resp = _session().get(
+            _SPARK_URL,
+            params={"symbols": ",".join(yahoo_symbols), "range": "1mo", "interval": "1d"},
+            headers={"User-Agent": "Mozilla/5.0"},
+            timeout=10,
+        )
+        resp.raise_for_status()
+        by_symbol = {item["symbol"]: item for item in resp.json()["spark"]["result"]}
+
+        rows: list[tuple[str, int, pd.Series]] = []
+        for (name, symbol, decimals), yahoo_symbol in zip(specs, yahoo_symbols):
+            entry = by_symbol[yahoo_symbol]["response"][0]
+            closes = entry["indicators"]["quote"][0]["close"]
+            index = pd.to_datetime(entry["timestamp"], unit="s").normalize()
+            series = pd.Series(closes, index=index, name="Close").dropna()
+            rows.append((name, decimals, series.loc[:cutoff]))
+
+        # 심볼별 스칼라 나눗셈 대신 (n, 2) 배열 하나로 등락률을 한 번에 계산한다.
+        # 심볼 수가 수백 개로 늘어도 같은 코드 경로가 그대로 확장된다
+        items: list[IndexSummary] = [None] * len(rows)  # type: ignore[list-item]
+        vec_idx: list[int] = []
+        for i, (name, decimals, series) in enumerate(rows):
+            if len(series) >= 2:
+                vec_idx.append(i)
+            else:
+                # 데이터 부족 케이스는 단건 경로가 오류 요약을 만들어 준다
+                items[i] = _summarize_closes(name, series, decimals)
+
+        if vec_idx:
+            last_two = np.array([rows[i][2].to_numpy()[-2:] for i in vec_idx])
+            pct = (last_two[:, 1] - last_two[:, 0]) / last_two[:, 0] * 100.0
+            signs = np.sign(pct).astype(int)
+            for j, i in enumerate(vec_idx):
+                name, decimals, series = rows[i]
+                arrow, color_class = _SIGN_MAP[int(signs[j])]
+                items[i] = IndexSummary(
+                    name=name,
+                    close=float(last_two[j, 1]),
+                    change_pct=float(pct[j]),
+                    arrow=arrow,
+                    color_class=color_class,
+                    base_date=series.index[-1].date().isoformat(),
+                    decimals=decimals,
+                )
+        return items
+    except Exception:  # noqa: BLE001 - 배치는 최적화 경로일 뿐, 실패하면 심볼별로 폴백
+        return [
+            fetch_index_summary(name, symbol, run_date, decimals, cache_dir)
+            for name, symbol, decimals in specs
+        ]
+
+
+async def _fetch_all(
+    specs: list[tuple[str, str, int]], run_date: date, cache_dir: Path | None = None
+) -> list[IndexSummary]:
+    """스펙 목록의 모든 지수를 한 이벤트 루프에서 동시에 가져온다.
+
+    FinanceDataReader는 동기 API라 각 호출을 to_thread로 감싸 gather한다.
+    """
+    return list(
+        await asyncio.gather(
+            *(
+                asyncio.to_thread(fetch_index_summary, name, symbol, run_date, decimals, cache_dir)
+                for name, symbol, decimals in specs
+            )
+        )
+    )
+
+
+# 셀 단위 마크업은 모듈 상수로 한 번만 만들어 두고 값만 채워 넣는다
+_HEADER_TMPL = "<th>{name}</th>"
+_CELL_TMPL = '<td><span class="{color_class}">{close} {arrow} {pct}</span></td>'
+_ROW_TMPL = "<tr>{cells}</tr>"
+
+
+def _render_table_rows(items: list[IndexSummary], columns: int) -> str:
+    rows: list[str] = []
+    for i in range(0, len(items), columns):
+        row_items = items[i : i + columns]
+        headers = [_HEADER_TMPL.format(name=item.name) for item in row_items]
+        cells = [
+            _CELL_TMPL.format(
+                color_class=item.color_class,
+                close=_format_close(item.close, item.decimals),
+                arrow=item.arrow,
+                pct=_format_pct(item.change_pct),
+            )
+            for item in row_items
+        ]
+        rows.append(_ROW_TMPL.format(cells="".join(headers)))
+        rows.append(_ROW_TMPL.format(cells="".join(cells)))
+    return "\n".join(rows)
+
+
+def _render_section(title: str, items: list[IndexSummary], columns: int) -> str:
+    return (
+        f"<h2>{title}</h2>"
+        "\n"
+        "<table>"
+        f"{_render_table_rows(items, columns)}"
+        "</table>"
+    )
+
+
+# 고정 마크업은 모듈 상수로 한 번만 만들어 두고 섹션 사이에 끼워 쓴다
+_HTML_HEAD = """<!doctype html>
+<html lang="ko">
+  <head>
+    <meta charset="utf-8" />
+    <meta name="viewport" content="width=device-width, initial-scale=1" />
+    <title>전일 시장 요약</title>
+    <style>
+      body {
+        font-family: -apple-system, BlinkMacSystemFont, "Segoe UI", Roboto, "Noto Sans KR", sans-serif;
+        margin: 24px;
+        color: #222;
+      }
+      h1 { margin: 0 0 24px; }
+      h2 { margin: 24px 0 8px; }
+      table {
+        width: 100%;
+        max-width: 720px;
+        border-collapse: collapse;
+        border-top: 1px solid #666;
+        margin-bottom: 24px;
+      }
+      th, td {
+        width: 50%;
+        border: 1px solid #d6d6d6;
+        text-align: center;
+        padding: 14px 10px;
+        font-size: 30px;
+      }
+      th { font-weight: 700; background: #fafafa; }
+      .up { color: #f44336; }
+      .down { color: #1976d2; }
+      .flat { color: #444; }
+      .na { color: #888; }
+      .meta { color: #666; font-size: 20px; margin: 6px 0; }
+      .warning { color: #b26a00; font-size: 18px; max-width: 720px; }
+    </style>
+  </head>
+  <body>
+    <h1>전일 시장 요약</h1>
+"""
+
+_HTML_FOOT = """  </body>
+</html>
+"""
+
+
+def write_html(
+    path: Path,
+    domestic_items: list[IndexSummary],
+    overseas_items: list[IndexSummary],
+    forex_items: list[IndexSummary],
+    commodity_items: list[IndexSummary],
+    generated_at: str,
+    requested_target_date: str | None,
+) -> None:
+    """섹션별로 만들어 바로 파일에 쓴다. 전체 HTML을 한 문자열로 들고 있지 않는다."""
+    all_items = domestic_items + overseas_items + forex_items + commodity_items
+    # ISO 날짜 문자열은 사전순 비교가 곧 날짜순이라 중간 리스트 없이 한 번에 고른다
+    base_date_text = max(
+        (item.base_date for item in all_items if item.base_date), default="확인 불가"
+    )
+    request_date_text = requested_target_date if requested_target_date else "자동(오늘 실행)"
+
+    warning = ""
+    details = ", ".join(f"{item.name}: {item.error}" for item in all_items if item.error)
+    if details:
+        warning = f"<p class=\"warning\">일부 데이터를 불러오지 못했습니다 ({details}).</p>"
+
+    with path.open("w", encoding="utf-8") as f:
+        f.write(_HTML_HEAD)
+        f.write(f"    {_render_section('국내', domestic_items, columns=2)}\n")
+        f.write(f"    {_render_section('해외', overseas_items, columns=2)}\n")
+        f.write(f"    {_render_section('환율', forex_items, columns=2)}\n")
+        f.write(f"    {_render_section('상품', commodity_items, columns=1)}\n")
+        f.write(f"    <p class=\"meta\">요청 실행일: {request_date_text}</p>\n")
+        f.write(f"    <p class=\"meta\">기준 거래일: {base_date_text}</p>\n")
+        f.write(f"    <p class=\"meta\">생성 시각: {generated_at}</p>\n")
+        f.write(f"    {warning}\n")
+        f.write(_HTML_FOOT)
+
+
+def _inputs_stamp(run_date: date, specs: list[tuple[str, str, int]]) -> str:
+    """출력이 의존하는 입력(실행일 + 심볼 구성)의 지문. 구성이 바뀌면 재생성한다."""
+    payload = run_date.isoformat() + "|" + ",".join(f"{symbol}:{decimals}" for _, symbol, decimals in specs)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--output-dir", default="output")
+    parser.add_argument("--target-date", default=None, help="YYYY-MM-DD 형식. 테스트/재현 실행용(실행일)")
+    parser.add_argument("--force", action="store_true", help="이미 생성된 HTML이 있어도 다시 생성")
+    args = parser.parse_args()
+
+    run_date = _parse_target_date(args.target_date) or date.today()
+    generated_at = datetime.now().strftime("%Y-%m-%d %H:%M")
+
+    domestic_specs = [
+        ("코스피", "KS11", 2),
+        ("코스닥", "KQ11", 2),
+    ]
+    overseas_specs = [
+        ("다우 산업", "DJI", 2),
+        ("나스닥 종합", "IXIC", 2),
+        ("상해 종합", "SSEC", 2),
+        ("니케이225", "N225", 2),
+    ]
+    forex_specs = [
+        ("원/달러", "USD/KRW", 2),
+        ("중국 위안/달러", "USD/CNY", 3),
+    ]
+    commodity_specs = [
+        ("금", "GC=F", 2),
+        ("은", "SI=F", 2),
+        ("WTI", "CL=F", 2),
+    ]
+
+    output_dir = Path(args.output_dir)
+    output_dir.mkdir(parents=True, exist_ok=True)
+    cache_dir = output_dir / ".cache"
+
+    # 재실행(워크플로 리플레이 등) 시 입력이 같으면 fetch/렌더 전체를 건너뛴다
+    filename_date = run_date.isoformat()
+    output_path = output_dir / f"{filename_date}_brief.html"
+    stamp_path = cache_dir / f"{filename_date}_brief.stamp"
+    stamp = _inputs_stamp(run_date, domestic_specs + overseas_specs + forex_specs + commodity_specs)
+    # 스탬프는 커밋되지 않는 캐시 디렉터리에 있어 새 체크아웃(CI 재실행)에는 없다.
+    # 있으면 입력 변경 여부까지 확인하고, 없으면 HTML 존재만으로 최신이라고 본다
+    if not args.force and output_path.exists():
+        if not stamp_path.exists() or stamp_path.read_text() == stamp:
+            print(f"Up-to-date: {output_path}")
+            return
+
+    # 지수별 fetch는 전부 외부 HTTP 대기라 이벤트 루프 하나에서 동시에 실행한다.
+    # 해외 지수는 Yahoo spark 배치 호출 한 번으로 묶고, 나머지는 심볼별로 받는다
+    other_specs = domestic_specs + forex_specs + commodity_specs
+
+    async def _run() -> list[list[IndexSummary]]:
+        return await asyncio.gather(
+            asyncio.to_thread(fetch_overseas_batch, overseas_specs, run_date, cache_dir),
+            _fetch_all(other_specs, run_date, cache_dir),
+        )
+
+    overseas_items, other_results = asyncio.run(_run())
+
+    domestic_items = other_results[: len(domestic_specs)]
+    offset = len(domestic_specs)
+    forex_items = other_results[offset : offset + len(forex_specs)]
+    offset += len(forex_specs)
+    commodity_items = other_results[offset:]
+
+    write_html(
+        output_path,
+        domestic_items,
+        overseas_items,
+        forex_items,
+        commodity_items,
+        generated_at,
+        args.target_date,
+    )
+    try:
+        stamp_path.parent.mkdir(parents=True, exist_ok=True)
+        stamp_path.write_text(stamp)
+    except OSError:
+        # 스탬프는 스킵 판단에만 쓰이므로 저장 실패해도 생성 결과에는 영향 없음
+        pass
+    print(f"Generated: {output_path}")
+
+
+if __name__ == "__main__":
+    main()